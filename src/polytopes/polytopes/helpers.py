@@ -109,31 +109,51 @@ https://en.wikipedia.org/wiki/Coxeter_group#Symmetry_groups_of_regular_polytopes
 for a complete list of valid Coxeter diagrams.")
         sys.exit(1)
 
-    np.seterrcall(err_handler)
-    np.seterr(all="call")
-
-    coxeter_matrix = np.array(make_symmetry_matrix(coxeter_diagram)).astype(np.float)
-    C = -np.cos(np.pi / coxeter_matrix)
-    M = np.zeros_like(C)
-
-    M[0, 0] = 1
-    M[1, 0] = C[0, 1]
-    M[1, 1] = np.sqrt(1 - M[1, 0]*M[1, 0])
-    M[2, 0] = C[0, 2]
-    M[2, 1] = (C[1, 2] - M[1, 0]*M[2, 0]) / M[1, 1]
-    M[2, 2] = np.sqrt(1 - M[2, 0]*M[2, 0] - M[2, 1]*M[2, 1])
-
-    if len(coxeter_matrix) > 3:
-        M[3, 0] = C[0, 3]
-        M[3, 1] = (C[1, 3] - M[1, 0]*M[3, 0]) / M[1, 1]
-        M[3, 2] = (C[2, 3] - M[2, 0]*M[3, 0] - M[2, 1]*M[3, 1]) / M[2, 2]
-        M[3, 3] = np.sqrt(1 - np.dot(M[3, :3], M[3, :3]))
-
-    if len(coxeter_matrix) == 5:
-        M[4, 0] = C[4, 0]
-        M[4, 1] = (C[4, 1] - M[1, 0]*M[4, 0]) / M[1, 1]
-        M[4, 2] = (C[4, 2] - M[2, 0]*M[4, 0] - M[2, 1]*M[4, 1]) / M[2, 2]
-        M[4, 3] = (C[4, 3] - M[3, 0]*M[4, 0] - M[3, 1]*M[4, 1] - M[3, 2]*M[4, 2]) / M[3, 3]
-        M[4, 4] = np.sqrt(1 - np.dot(M[4, :4], M[4, :4]))
+    # only check the floating point errors in the computation below, the
+    # global numpy error handling is left untouched.
+    with np.errstate(all="call", call=err_handler):
+        coxeter_matrix = np.array(make_symmetry_matrix(coxeter_diagram)).astype(np.float)
+        C = -np.cos(np.pi / coxeter_matrix)
+        M = np.zeros_like(C)
+
+        M[0, 0] = 1
+        M[1, 0] = C[0, 1]
+        M[1, 1] = np.sqrt(1 - M[1, 0]*M[1, 0])
+        M[2, 0] = C[0, 2]
+        M[2, 1] = (C[1, 2] - M[1, 0]*M[2, 0]) / M[1, 1]
+        M[2, 2] = np.sqrt(1 - M[2, 0]*M[2, 0] - M[2, 1]*M[2, 1])
+
+        if len(coxeter_matrix) > 3:
+            M[3, 0] = C[0, 3]
+            M[3, 1] = (C[1, 3] - M[1, 0]*M[3, 0]) / M[1, 1]
+            M[3, 2] = (C[2, 3] - M[2, 0]*M[3, 0] - M[2, 1]*M[3, 1]) / M[2, 2]
+            M[3, 3] = np.sqrt(1 - np.dot(M[3, :3], M[3, :3]))
+
+        if len(coxeter_matrix) == 5:
+            M[4, 0] = C[4, 0]
+            M[4, 1] = (C[4, 1] - M[1, 0]*M[4, 0]) / M[1, 1]
+            M[4, 2] = (C[4, 2] - M[2, 0]*M[4, 0] - M[2, 1]*M[4, 1]) / M[2, 2]
+            M[4, 3] = (C[4, 3] - M[3, 0]*M[4, 0] - M[3, 1]*M[4, 1] - M[3, 2]*M[4, 2]) / M[3, 3]
+            M[4, 4] = np.sqrt(1 - np.dot(M[4, :4], M[4, :4]))
 
     return M
+
+
+def get_word_layers(words):
+    """
+    Given a list of words in BFS order (e.g. the output of `CosetTable.get_words()`,
+    so the prefix of a word always comes before it), group the non-empty words
+    by their lengths and last letters. Return a list of triples `(x, children, parents)`,
+    where `children` are the indices of the words in this group and `parents` are the
+    indices of their prefixes obtained by dropping the common last letter `x`.
+    The groups are sorted by word length so a prefix is always processed before
+    the words that extend it.
+    """
+    index = {word: k for k, word in enumerate(words)}
+    layers = {}
+    for k, word in enumerate(words):
+        if word:
+            children, parents = layers.setdefault((len(word), word[-1]), ([], []))
+            children.append(k)
+            parents.append(index[word[:-1]])
+    return [(x, children, parents) for (_, x), (children, parents) in sorted(layers.items())]
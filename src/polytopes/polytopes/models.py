@@ -7,20 +7,72 @@ Classes for building models of 3D/4D/5D uniform polytopes
 See the doc: "https://neozhaoliang.github.io/polytopes/"
 
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, reduce
 from itertools import combinations
 import numpy as np
 from . import helpers
-from .todd_coxeter import CosetTable
+from .todd_coxeter import CosetTable, flatten_words
 from .povray import export_polytope_data
 
 
+@lru_cache(maxsize=64)
+def _build_reflections(coxeter_diagram):
+    """
+    Return the Coxeter matrix, the mirrors and the reflection matrices
+    of a Coxeter diagram. They depend only on the diagram so they are
+    cached and shared between instances, hence the arrays are read-only.
+    """
+    coxeter_matrix = tuple(tuple(row) for row in helpers.get_coxeter_matrix(coxeter_diagram))
+    mirrors = helpers.get_mirrors(coxeter_diagram)
+    # stack the reflections into one (n, d, d) array
+    reflections = np.stack([helpers.reflection_matrix(v) for v in mirrors])
+    for arr in (mirrors, reflections):
+        arr.setflags(write=False)
+    return coxeter_matrix, mirrors, reflections
+
+
+def _word_action(vtable, words, vertices):
+    """
+    Return a 2d integer array `W` of shape (len(vertices), len(words)) such
+    that `W[i, k]` is the vertex obtained by moving `vertices[i]` by the k-th
+    word, using the vertex coset table `vtable` stored as a 2d array.
+    """
+    action = np.empty((len(vertices), len(words)), dtype=np.int32)
+    # the first word is always the empty word
+    action[:, 0] = vertices
+    for x, children, parents in helpers.get_word_layers(words):
+        action[:, children] = vtable[action[:, parents], x]
+    return action
+
+
+def _coset_representatives(gens, rels, rels_offsets, subgens, coxeter):
+    """
+    Enumerate the cosets of the subgroup generated by `subgens` and return
+    the words of the coset representatives.
+    """
+    table = CosetTable(gens, rels, subgens, coxeter, rels_offsets=rels_offsets)
+    table.run()
+    return table.get_words()
+
+
+def _stabilizer_orbit(gens, rels, rels_offsets, subgens, coxeter, vtable, base):
+    """
+    Apply the coset representatives of the stabilizing subgroup generated by
+    `subgens` to a base edge/face `base`, return the orbit as a 2d array.
+    This is a module-level function so it can be run in a worker process.
+    """
+    coset_reps = _coset_representatives(gens, rels, rels_offsets, subgens, coxeter)
+    return _word_action(vtable, coset_reps, np.asarray(base, dtype=np.int32)).T
+
+
 class BasePolytope(object):
 
     """
     Base class for building uniform polytopes using Wythoff's construction.
     """
 
-    def __init__(self, coxeter_diagram, init_dist, extra_relations=()):
+    def __init__(self, coxeter_diagram, init_dist, extra_relations=(), dtype=np.float64):
         """
         :param coxeter_diagram: Coxeter diagram for this polytope.
         :param init_dist: distances between the initial vertex and the mirrors.
@@ -32,18 +84,26 @@ class BasePolytope(object):
                 "Regular skew polyhedra in three and four dimensions,
                  and their topological analogues"
 
+        :param dtype: float type of the mirrors, reflections and coordinates.
+            np.float32 is enough if the data is only used for POV-Ray rendering
+            and halves the memory traffic of the word matrices.
         """
-        # Coxeter matrix of the symmetry group
-        self.coxeter_matrix = helpers.get_coxeter_matrix(coxeter_diagram)
-
-        # reflectiom mirrors stored as row vectors in a matrix
-        self.mirrors = helpers.get_mirrors(coxeter_diagram)
+        # float type of the geometry
+        self.dtype = np.dtype(dtype)
 
+        # Coxeter matrix of the symmetry group,
+        # reflectiom mirrors stored as row vectors in a matrix,
         # reflection transformations about the mirrors
-        self.reflections = tuple(helpers.reflection_matrix(v) for v in self.mirrors)
+        coxeter_matrix, mirrors, reflections = _build_reflections(tuple(coxeter_diagram))
+        self.coxeter_matrix = coxeter_matrix
+        # the arrays are read-only whether or not they are shared with the cache
+        self.mirrors = mirrors.astype(self.dtype, copy=False)
+        self.reflections = reflections.astype(self.dtype, copy=False)
+        for arr in (self.mirrors, self.reflections):
+            arr.setflags(write=False)
 
-        # the initial vertex
-        self.init_v = helpers.get_init_point(self.mirrors, init_dist)
+        # the initial vertex, it's solved in double precision
+        self.init_v = helpers.get_init_point(mirrors, init_dist).astype(self.dtype)
 
         # a mirror is active if and only if the initial vertex has non-zero distance to it
         self.active = tuple(bool(x) for x in init_dist)
@@ -51,7 +111,8 @@ class BasePolytope(object):
         # generators of the symmetry group
         self.symmetry_gens = tuple(range(len(self.coxeter_matrix)))
 
-        # relations between the generators
+        # relations between the generators: (ρiρj)^m = 1, they are
+        # concatenated into an int array in `symmetry_rels_flat`
         self.symmetry_rels = tuple((i, j) * self.coxeter_matrix[i][j]
                                    for i, j in combinations(self.symmetry_gens, 2))
         # add the extra relations between generators (only used for star polytopes)
@@ -59,23 +120,57 @@ class BasePolytope(object):
 
         # multiplication table bwteween the vertices
         self.vtable = None
+        # the same table stored as a 2d integer array
+        self._vtbl = None
         # word representations of the vertices
         self.vwords = None
+        # cached results of `get_orthogonal_stabilizing_mirrors`
+        self._orthogonal_mirrors = {}
+        # cached result of `symmetry_rels_flat`
+        self._rels_flat = None
 
         # number of vertices, edges, faces
         self.num_vertices = 0
         self.num_edges = 0
         self.num_faces = 0
 
-        # coordinates of the vertices, indices of the edges and faces
-        self.vertices_coords = []
+        # coordinates of the vertices stored as row vectors in a matrix,
+        # indices of the edges and faces
+        self.vertices_coords = np.empty((0, len(self.init_v)), dtype=self.dtype)
         self.edge_indices = []
         self.face_indices = []
 
-    def build_geometry(self):
+    @property
+    def symmetry_rels_flat(self):
+        """
+        The relations between the generators concatenated into a 1d int32
+        array, together with their offsets (see `flatten_words`).
+        This is computed from `self.symmetry_rels` on first access instead of
+        in `__init__` since the snub subclasses overwrite the relations after
+        `__init__`, then it's shared by all coset tables of this polytope.
+        """
+        if self._rels_flat is None:
+            self._rels_flat = flatten_words(self.symmetry_rels)
+        return self._rels_flat
+
+    def _new_coset_table(self, subgens=(), coxeter=True):
+        """
+        :param subgens: a list of generating words of the subgroup, e.g. [(0,), (1, 2)]
+
+        Return a new coset table of the symmetry group for the subgroup generated
+        by `subgens`. The generators and the flattened relations are passed by
+        reference so nothing is rebuilt for each table.
+        """
+        rels, offsets = self.symmetry_rels_flat
+        return CosetTable(self.symmetry_gens, rels, subgens, coxeter, rels_offsets=offsets)
+
+    def build_geometry(self, max_workers=1):
+        """
+        :param max_workers: number of worker processes used in `get_faces`.
+        """
         self.get_vertices()
         self.get_edges()
-        self.get_faces()
+        self.get_faces(max_workers)
 
     def get_vertices(self):
         """
@@ -87,13 +182,14 @@ class BasePolytope(object):
         """
         # generators of the stabilizing subgroup that fixes the initial vertex.
         vgens = [(i,) for i, active in enumerate(self.active) if not active]
-        self.vtable = CosetTable(self.symmetry_gens, self.symmetry_rels, vgens)
+        self.vtable = self._new_coset_table(vgens)
         self.vtable.run()
+        self._vtbl = np.asarray(self.vtable.table, dtype=np.int32)
         # word representations of the vertices
         self.vwords = self.vtable.get_words()
         self.num_vertices = len(self.vwords)
         # apply words of the vertices to the initial vertex to get all vertices
-        self.vertices_coords = tuple(self.transform(self.init_v, w) for w in self.vwords)
+        self.vertices_coords = self.transform_words(self.init_v, self.vwords)
 
     def get_edges(self):
         """
@@ -114,43 +210,59 @@ class BasePolytope(object):
                 e0 = (0, self.move(0, (i,)))
                 # generators of the edge stabilizing subgroup
                 egens = [(i,)] + self.get_orthogonal_stabilizing_mirrors((i,))
-                # get word representations of the edges
-                coset_reps = self.get_coset_representatives(egens)
-                # apply them to the base edge to get all edges of type i
-                orbit = self.get_orbit(coset_reps, e0)
+                # if all mirrors that fix v0 commute with ρi then the edge
+                # stabilizing subgroup is <ρi> x (the vertex stabilizing subgroup),
+                # so the vertex words move e0 to each edge of type i exactly twice
+                # (once from each end) and no new coset table is needed.
+                if len(egens) == self.active.count(False) + 1:
+                    orbit = self.get_orbit(self.vwords, e0)
+                    orbit = orbit[orbit[:, 0] < orbit[:, 1]]
+                else:
+                    # get word representations of the edges
+                    coset_reps = self.get_coset_representatives(egens)
+                    # apply them to the base edge to get all edges of type i
+                    orbit = self.get_orbit(coset_reps, e0)
                 self.edge_indices.append(orbit)
                 self.num_edges += len(orbit)
 
-    def get_faces(self):
+    def get_faces(self, max_workers=1):
         """
         Compute the indices of all faces.
         The composition of the i-th and the j-th reflection is a rotation
         which fixes a base face f. The stabilizing subgroup of f is generated
         by {ρi, ρj} plus those simple reflections ρk such that ρk fixes the
         initial vertex v0 and commutes with both ρi and ρj.
+
+        :param max_workers: see `get_stabilizer_orbits`.
         """
+        # base faces and the generators of their stabilizing subgroups
+        base_faces = []
         for i, j in combinations(self.symmetry_gens, 2):
             m = self.coxeter_matrix[i][j]
-            f0 = []
             # if both two mirrors are active then they generate a face
+            # with vertices v0(ρiρj)^k and v0ρj(ρiρj)^k
             if self.active[i] and self.active[j]:
-                for k in range(m):
-                    f0.append(self.move(0, (i, j) * k))
-                    f0.append(self.move(0, (j,) + (i, j) * k))
+                start = (0, self.move(0, (j,)))
             # if exactly one of the two mirrors are active then they
             # generate a face only when they are not perpendicular
             elif (self.active[i] or self.active[j]) and m > 2:
-                for k in range(m):
-                    f0.append(self.move(0, (i, j) * k))
+                start = (0,)
             # else they do not generate a face
             else:
                 continue
 
+            # rotate the starting vertices by ρiρj for m - 1 times
+            f0 = [np.asarray(start)]
+            for _ in range(m - 1):
+                f0.append(self.move_many(f0[-1], (i, j)))
+            f0 = np.concatenate(f0)
+
             # generators of the face stabilizing subgroup
             fgens = [(i,), (j,)] + self.get_orthogonal_stabilizing_mirrors([i, j])
-            coset_reps = self.get_coset_representatives(fgens)
-            # apply the coset representatives to the base face
-            orbit = self.get_orbit(coset_reps, f0)
+            base_faces.append((fgens, f0))
+
+        # apply the coset representatives to the base faces
+        for orbit in self.get_stabilizer_orbits(base_faces, max_workers=max_workers):
             self.face_indices.append(orbit)
             self.num_faces += len(orbit)
 
@@ -162,9 +274,37 @@ class BasePolytope(object):
         Transform a vector by a word in the symmetry group.
         Return the coordinates of the resulting vector.
         """
-        for w in word:
-            vector = np.dot(vector, self.reflections[w])
-        return vector
+        return reduce(np.dot, self.reflections[list(word)], vector)
+
+    def get_word_matrices(self, words):
+        """
+        :param words: a list of words in BFS order, e.g. `self.vwords`.
+
+        Return a 3d array of shape (len(words), d, d) whose k-th entry is
+        the matrix of the k-th word, i.e. the product of the matrices of its
+        letters. The words are processed layer by layer: all words of the same
+        length that end with the same letter are obtained from their prefixes
+        by a single call of `self.transform`.
+        """
+        dim = len(self.init_v)
+        mats = np.empty((len(words), dim, dim), dtype=self.dtype)
+        # the first word is always the empty word
+        mats[0] = np.eye(dim)
+        for x, children, parents in helpers.get_word_layers(words):
+            mats[children] = self.transform(mats[parents], (x,))
+        return mats
+
+    def transform_words(self, vector, words):
+        """
+        :param vector: a 1d array, e.g. (1, 0, 0).
+        :param words: a list of words in BFS order, e.g. `self.vwords`.
+
+        Transform a vector by all words in `words`. Return a 2d array whose
+        k-th row is the image of `vector` under the k-th word.
+        All words are applied by one batched contraction with the stack of
+        word matrices, letting einsum pick the BLAS-backed evaluation path.
+        """
+        return np.einsum("j,njk->nk", vector, self.get_word_matrices(words), optimize=True)
 
     def move(self, vertex, word):
         """
@@ -175,24 +315,55 @@ class BasePolytope(object):
         Return the index of the resulting vertex.
         """
         for w in word:
-            vertex = self.vtable[vertex][w]
+            vertex = self._vtbl[vertex, w]
         return vertex
 
+    def move_many(self, vertices, word):
+        """
+        :param vertices: a 1d array of integers.
+        :param word: a list of integers.
+
+        Transform an array of vertices by a word in the symmetry group.
+        Return the indices of the resulting vertices.
+        """
+        vertices = np.asarray(vertices)
+        for w in word:
+            vertices = self._vtbl[vertices, w]
+        return vertices
+
+    def get_word_action(self, words, vertices=None):
+        """
+        :param words: a list of words in BFS order, e.g. `self.vwords`.
+        :param vertices: a 1d list of integers, default to all vertices.
+
+        Return a 2d integer array `W` of shape (len(vertices), len(words))
+        such that `W[i, k] = self.move(vertices[i], words[k])`. Each column is
+        computed from the column of its prefix by one table lookup, so a whole
+        layer of words is handled by a single fancy-index gather.
+        """
+        if vertices is None:
+            vertices = np.arange(self.num_vertices)
+        return _word_action(self._vtbl, words, vertices)
+
     def get_orthogonal_stabilizing_mirrors(self, subgens):
         """
         :param subgens: a list of generators, e.g. [0, 1]
 
         Given a list of generators in `subgens`, return the generators that
         commute with all of those in `subgens` and fix the initial vertex.
-        """
-        result = []
-        for s in self.symmetry_gens:
-            # check commutativity
-            if all(self.coxeter_matrix[x][s] == 2 for x in subgens):
-                # check if it fixes v0
-                if not self.active[s]:
-                    result.append((s,))
-        return result
+        The Coxeter matrix never changes so the results are cached.
+        """
+        key = tuple(subgens)
+        if key not in self._orthogonal_mirrors:
+            result = []
+            for s in self.symmetry_gens:
+                # check commutativity
+                if all(self.coxeter_matrix[x][s] == 2 for x in subgens):
+                    # check if it fixes v0
+                    if not self.active[s]:
+                        result.append((s,))
+            self._orthogonal_mirrors[key] = result
+        return list(self._orthogonal_mirrors[key])
 
     def get_coset_representatives(self, subgens, coxeter=True):
         """
@@ -200,9 +371,8 @@ class BasePolytope(object):
 
         Get the set of coset representatives of a subgroup generated by `subgens`.
         """
-        table = CosetTable(self.symmetry_gens, self.symmetry_rels, subgens, coxeter)
-        table.run()
-        return table.get_words()
+        rels, offsets = self.symmetry_rels_flat
+        return _coset_representatives(self.symmetry_gens, rels, offsets, subgens, coxeter)
 
     def get_orbit(self, coset_reps, base):
         """
@@ -210,8 +380,35 @@ class BasePolytope(object):
         :param base: a 1d list of integers.
 
         Apply the words in `coset_reps` to a base edge/face.
+        Return a 2d integer array whose k-th row is the image of `base`
+        under the k-th word.
+        """
+        # only the action on the vertices of `base` is needed
+        return self.get_word_action(coset_reps, base).T
+
+    def get_stabilizer_orbits(self, stabilizers, coxeter=True, max_workers=1):
+        """
+        :param stabilizers: a list of pairs (subgens, base), where `subgens`
+            generates the stabilizing subgroup of the base edge/face `base`.
+        :param max_workers: the orbits are independent, if `max_workers`
+            is not 1 they are computed in a pool of worker processes
+            (None means one process per CPU). Starting the processes costs
+            more than the whole computation for small polytopes, so by
+            default everything runs in the current process.
+
+        Return the list of orbits, the same as calling `get_orbit` with
+        `get_coset_representatives(subgens, coxeter)` for each pair.
         """
-        return [[self.move(v, word) for v in base] for word in coset_reps]
+        rels, offsets = self.symmetry_rels_flat
+        args = [(self.symmetry_gens, rels, offsets, subgens, coxeter, self._vtbl, base)
+                for subgens, base in stabilizers]
+        if max_workers == 1:
+            return [_stabilizer_orbit(*arg) for arg in args]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_stabilizer_orbit, *arg) for arg in args]
+            # collect the results in submission order
+            return [future.result() for future in futures]
 
     def get_latex_format(self, symbol=r"\rho", cols=3, snub=False):
         """
@@ -245,10 +442,10 @@ class Polyhedra(BasePolytope):
     Base class for 3d polyhedron.
     """
 
-    def __init__(self, coxeter_diagram, init_dist, extra_relations=()):
+    def __init__(self, coxeter_diagram, init_dist, extra_relations=(), dtype=np.float64):
         if not len(coxeter_diagram) == len(init_dist) == 3:
             raise ValueError("Length error: the inputs must all have length 3")
-        super().__init__(coxeter_diagram, init_dist, extra_relations)
+        super().__init__(coxeter_diagram, init_dist, extra_relations, dtype)
 
 
 class Snub(Polyhedra):
@@ -264,8 +461,8 @@ class Snub(Polyhedra):
     transform the initial vertex to get all vertices.
     """
 
-    def __init__(self, coxeter_diagram, init_dist=(1.0, 1.0, 1.0)):
-        super().__init__(coxeter_diagram, init_dist, extra_relations=())
+    def __init__(self, coxeter_diagram, init_dist=(1.0, 1.0, 1.0), dtype=np.float64):
+        super().__init__(coxeter_diagram, init_dist, extra_relations=(), dtype=dtype)
         # the representaion is not in the form of a Coxeter group,
         # we must overwrite the relations.
 
@@ -289,16 +486,23 @@ class Snub(Polyhedra):
                           (2,): self.coxeter_matrix[1][2],
                           (0, 2): self.coxeter_matrix[0][2]}
 
+        # matrices of the generators (r, r^-1, s, s^-1),
+        # the inverse of a rotation is its transpose.
+        R = self.reflections
+        r, s = np.dot(R[0], R[1]), np.dot(R[1], R[2])
+        self.rot_mats = np.stack([r, r.T, s, s.T])
+
     def get_vertices(self):
         """
         Get the vertices of this snub polyhedra.
         """
         # the stabilizing subgroup of the initial vertex contains only 1
-        self.vtable = CosetTable(self.symmetry_gens, self.symmetry_rels, coxeter=False)
+        self.vtable = self._new_coset_table(coxeter=False)
         self.vtable.run()
+        self._vtbl = np.asarray(self.vtable.table, dtype=np.int32)
         self.vwords = self.vtable.get_words()
         self.num_vertices = len(self.vwords)
-        self.vertices_coords = tuple(self.transform(self.init_v, w) for w in self.vwords)
+        self.vertices_coords = self.transform_words(self.init_v, self.vwords)
 
     def get_edges(self):
         """
@@ -324,7 +528,7 @@ class Snub(Polyhedra):
             self.edge_indices.append(orbit)
             self.num_edges += len(orbit)
 
-    def get_faces(self):
+    def get_faces(self, max_workers=1):
         """
         Get the face indices of this snub polyhedra.
         Each rotation of the three "fundamental rotations" {r, s, rs}
@@ -336,17 +540,21 @@ class Snub(Polyhedra):
         Note (v0, v0s) is an edge of type s, (v0, v0rs) is an edge of type rs,
         (v0s, v0rs) is an edge of type r since it's in the same orbit of the
         edge (v0, v0r) by applying s on it.
+
+        :param max_workers: see `get_stabilizer_orbits`.
         """
+        base_faces = []
         for rot, order in self.rotations.items():
             # if the order of this rotation is > 2 then it generates a face
             if order > 2:
                 f0 = tuple(self.move(0, rot * k) for k in range(order))
                 # the stabilizing group is the cyclic group <rot>
                 fgens = (rot,)
-                coset_reps = self.get_coset_representatives(fgens, coxeter=False)
-                orbit = self.get_orbit(coset_reps, f0)
-                self.face_indices.append(orbit)
-                self.num_faces += len(orbit)
+                base_faces.append((fgens, f0))
+
+        for orbit in self.get_stabilizer_orbits(base_faces, coxeter=False, max_workers=max_workers):
+            self.face_indices.append(orbit)
+            self.num_faces += len(orbit)
 
         # handle the special triangle face (v0, v0s, v0rs)
         # note its three edges are in different orbits so
@@ -360,16 +568,9 @@ class Snub(Polyhedra):
         """
         Transform a vector by a word in the group.
         Return the coordinates of the resulting vector.
-        Note generator 0 means r = ρ0ρ1, generator 1 means s = ρ1ρ2.
+        Note generator 0 means r = ρ0ρ1, generator 2 means s = ρ1ρ2.
         """
-        for g in word:
-            if g == 0:
-                vector = np.dot(vector, self.reflections[0])
-                vector = np.dot(vector, self.reflections[1])
-            else:
-                vector = np.dot(vector, self.reflections[1])
-                vector = np.dot(vector, self.reflections[2])
-        return vector
+        return reduce(np.dot, self.rot_mats[list(word)], vector)
 
 
 class Polychora(BasePolytope):
@@ -378,10 +579,10 @@ class Polychora(BasePolytope):
     Base class for 4d polychoron.
     """
 
-    def __init__(self, coxeter_diagram, init_dist, extra_relations=()):
+    def __init__(self, coxeter_diagram, init_dist, extra_relations=(), dtype=np.float64):
         if not (len(coxeter_diagram) == 6 and len(init_dist) == 4):
             raise ValueError("Length error: the input coxeter_diagram must have length 6 and init_dist has length 4")
-        super().__init__(coxeter_diagram, init_dist, extra_relations)
+        super().__init__(coxeter_diagram, init_dist, extra_relations, dtype)
 
 
 class Polytope5D(BasePolytope):
@@ -390,16 +591,17 @@ class Polytope5D(BasePolytope):
     Base class for 5d uniform polytopes.
     """
 
-    def __init__(self, coxeter_diagram, init_dist, extra_relations=()):
+    def __init__(self, coxeter_diagram, init_dist, extra_relations=(), dtype=np.float64):
         if len(coxeter_diagram) != 10 and len(init_dist) != 5:
             raise ValueError("Length error: the input coxeter_diagram must have length 10 and init_dist has length 5")
-        super().__init__(coxeter_diagram, init_dist, extra_relations)
+        super().__init__(coxeter_diagram, init_dist, extra_relations, dtype)
 
     def proj4d(self, pole=1.3):
         """
         Stereographic project vertices to 4d.
         """
-        self.vertices_coords = [v[:4] / (pole - v[-1]) for v in self.vertices_coords]
+        V = self.vertices_coords
+        self.vertices_coords = V[:, :4] / (pole - V[:, -1:])
         return self
 
 
@@ -423,10 +625,10 @@ class Snub24Cell(Polychora):
 
     """
 
-    def __init__(self):
+    def __init__(self, dtype=np.float64):
         coxeter_diagram = (3, 2, 2, 3, 3, 2)
         active = (1, 1, 1, 1)
-        super().__init__(coxeter_diagram, active, extra_relations=())
+        super().__init__(coxeter_diagram, active, extra_relations=(), dtype=dtype)
         # generators in order: {r, r^-1, s, s^-1, t, t^-1}
         self.symmetry_gens = tuple(range(6))
         # relations in order:
@@ -451,15 +653,22 @@ class Snub24Cell(Polychora):
                           (0, 4): 2,
                           (3, 4): 2}
 
+        # matrices of the generators (r, r^-1, s, s^-1, t, t^-1),
+        # the inverse of a rotation is its transpose.
+        R = self.reflections
+        r, s, t = np.dot(R[0], R[1]), np.dot(R[1], R[2]), np.dot(R[1], R[3])
+        self.rot_mats = np.stack([r, r.T, s, s.T, t, t.T])
+
     def get_vertices(self):
         """
         Get the coordinates of the snub 24-cell.
         """
-        self.vtable = CosetTable(self.symmetry_gens, self.symmetry_rels, coxeter=False)
+        self.vtable = self._new_coset_table(coxeter=False)
         self.vtable.run()
+        self._vtbl = np.asarray(self.vtable.table, dtype=np.int32)
         self.vwords = self.vtable.get_words()
         self.num_vertices = len(self.vwords)
-        self.vertices_coords = tuple(self.transform(self.init_v, w) for w in self.vwords)
+        self.vertices_coords = self.transform_words(self.init_v, self.vwords)
 
     def get_edges(self):
         """
@@ -481,7 +690,7 @@ class Snub24Cell(Polychora):
             self.edge_indices.append(orbit)
             self.num_edges += len(orbit)
 
-    def get_faces(self):
+    def get_faces(self, max_workers=1):
         """
         Get the faces of the snub 24-cell.
 
@@ -492,13 +701,17 @@ class Snub24Cell(Polychora):
 
         There are also some triangle faces generated by relations like
         r1r2 = r3, where r1, r2, r3 are three fundamental rotations.
+
+        :param max_workers: see `get_stabilizer_orbits`.
         """
+        base_faces = []
         for rot in ((0,), (2,), (4,)):
             order = self.rotations[rot]
             f0 = tuple(self.move(0, rot * k) for k in range(order))
             fgens = (rot,)
-            coset_reps = self.get_coset_representatives(fgens, coxeter=False)
-            orbit = self.get_orbit(coset_reps, f0)
+            base_faces.append((fgens, f0))
+
+        for orbit in self.get_stabilizer_orbits(base_faces, coxeter=False, max_workers=max_workers):
             self.face_indices.append(orbit)
             self.num_faces += len(orbit)
 
@@ -521,14 +734,4 @@ class Snub24Cell(Polychora):
         """
         The generators are 0 for r=ρ0ρ1, 2 for s=ρ1ρ2, 4 for t=ρ1ρ3.
         """
-        for g in word:
-            if g == 0:
-                vector = np.dot(vector, self.reflections[0])
-                vector = np.dot(vector, self.reflections[1])
-            elif g == 2:
-                vector = np.dot(vector, self.reflections[1])
-                vector = np.dot(vector, self.reflections[2])
-            else:
-                vector = np.dot(vector, self.reflections[1])
-                vector = np.dot(vector, self.reflections[3])
-        return vector
+        return reduce(np.dot, self.rot_mats[list(word)], vector)
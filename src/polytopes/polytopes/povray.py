@@ -1,6 +1,7 @@
 """
 Some POV-Ray stuff.
 """
+import numpy as np
 
 
 def concat(arr, sep=",\n", border=None):
@@ -65,8 +66,11 @@ def pov_index_array3d(arr3d):
 def export_polytope_data(P):
     """
     Return the data of a polytope `P` in POV-Ray format.
+    The vertices and the edge/face indices of `P` may be numpy arrays or
+    nested lists, they are converted to nested lists in one go so the
+    formatting below only deals with plain Python numbers.
     """
-    vert_data = pov_vector_array(P.vertices_coords)
-    edge_data = pov_index_array3d(P.edge_indices)
-    face_data = pov_index_array3d(P.face_indices)
+    vert_data = pov_vector_array(np.asarray(P.vertices_coords).tolist())
+    edge_data = pov_index_array3d([np.asarray(arr).tolist() for arr in P.edge_indices])
+    face_data = pov_index_array3d([np.asarray(arr).tolist() for arr in P.face_indices])
     return vert_data, edge_data, face_data
@@ -10,7 +10,298 @@ Reference:
     [3] GAP doc at "https://www.gap-system.org/Manuals/doc/ref/chap47.html".
     [4] Ken Brown's code at "http://www.math.cornell.edu/~kbrown/toddcox/".
 
+The inner loops of the algorithm are pure integer arithmetic on the table,
+they are compiled with numba and operate on a dense 2D int32 array in which
+an undefined entry is marked by -1.
 """
+from itertools import chain
+import numpy as np
+from numba import jit
+
+
+UNDEFINED = -1
+
+
+def flatten_words(words):
+    """
+    Concatenate a list of words into a 1D int32 array `flat` and return it
+    together with an array `offsets` of length len(words) + 1, so that the
+    k-th word is `flat[offsets[k]: offsets[k+1]]`.
+    """
+    lengths = [len(word) for word in words]
+    flat = np.fromiter(chain.from_iterable(words), dtype=np.int32, count=sum(lengths))
+    offsets = np.zeros(len(words) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum(lengths)
+    return flat, offsets
+
+
+@jit(nopython=True, cache=True)
+def _inv(x, coxeter):
+    """The inverse of a generator `x`."""
+    if coxeter:
+        return x
+    return x - 1 if x % 2 else x + 1
+
+
+@jit(nopython=True, cache=True)
+def _define(table, p, n, coset, x, coxeter):
+    """To define a new coset `n` we need to:
+        1. Use a new empty row of the table.
+        2. Fill the two entries.
+        3. Add this new coset to `p`.
+       The caller must make sure the table has room for row `n`.
+       Return the new number of cosets.
+    """
+    table[coset, x] = n
+    table[n, _inv(x, coxeter)] = coset
+    p[n] = n
+    return n + 1
+
+
+@jit(nopython=True, cache=True)
+def _rep(p, coset):
+    """Find the minimal equivalent representative of a given coset and
+       modify `p` along the way.
+    """
+    m = coset
+    while m != p[m]:
+        m = p[m]
+
+    j = coset
+    while j != p[j]:
+        k = p[j]
+        p[j] = m
+        j = k
+
+    return m
+
+
+@jit(nopython=True, cache=True)
+def _merge(p, q, tail, coset1, coset2):
+    """Merge two equivalent cosets. The larger one is declared
+       to "dead" and is appended to the queue `q` to be processed later on.
+       Return the new tail of the queue.
+    """
+    s = _rep(p, coset1)
+    t = _rep(p, coset2)
+    if s != t:
+        if s > t:
+            s, t = t, s
+        p[t] = s
+        q[tail] = t
+        tail += 1
+    return tail
+
+
+@jit(nopython=True, cache=True)
+def _coincidence(table, p, q, coset1, coset2, coxeter):
+    """
+    Process a coincidence. When two cosets are found to be equivalent
+    the larger one is deleted: we need to copy all information in its
+    row to the equivalent row and modify all entries it occurs in the
+    table. During this process new coincidences may be found and they
+    are also processed. The subtle thing here is that we must keep
+    filling/deleting entries in pairs, i.e. we must make sure the table
+    always satisfy table[k][x] = l <===> table[l][y] = k (y = inv(x)).
+
+    A coset is declared dead only once, so the queue `q` never holds
+    more items than the number of rows of the table.
+    """
+    head = 0
+    tail = _merge(p, q, 0, coset1, coset2)
+    # at this stage the queue contains only one item,
+    # but new items may be added to it later.
+    while head < tail:
+        e = q[head]
+        head += 1
+        for x in range(table.shape[1]):
+            f = table[e, x]
+            if f != UNDEFINED:
+                y = _inv(x, coxeter)
+                # the entry (f, y) in the row f is also deleted since we
+                # must make sure all entries in the table come in pairs.
+                table[f, y] = UNDEFINED
+                # copy the information at (e, x) to (e1, x),
+                # but is (e1, x) already defined?
+                e1 = _rep(p, e)
+                f1 = _rep(p, f)
+                # if (e1, x) is already defined then
+                # a new coincidence is found.
+                if table[e1, x] != UNDEFINED:
+                    tail = _merge(p, q, tail, f1, table[e1, x])
+                elif table[f1, y] != UNDEFINED:
+                    tail = _merge(p, q, tail, e1, table[f1, y])
+                else:
+                    # else (e1, x) is not defined, copy the information
+                    # at (e, x) to (e1, x).
+                    # keep in mind all changes come in pairs,
+                    # so we also copy the information at (f, y) to (f1, y).
+                    table[e1, x] = f1
+                    table[f1, y] = e1
+
+
+@jit(nopython=True, cache=True)
+def _scan_and_fill(table, p, q, n, coset, word, coxeter):
+    """
+    Scan the row of a coset under a given word.
+    1. Firstly we start from the left and scan forward to the right as
+       far as possible.
+       (1a) If it completes correctly then it yields no
+            information, do nothing.
+       (1b) If it completes incorrectly then a coincidence
+            is found, process it.
+       (1c) If it does not complete, go to step 2.
+    2. Then we start from the right and scan backward to the left as far
+       as possible until it "meets" the forward scan `f`. Let this scan
+       results in coset `b`.
+       (2a) if `f` and `b` overlap, then a coincidence
+            is found, process it.
+       (2b) if `f` and `b` are about to meet (with a length 1 gap between)
+            then a deduction is found, fill in the two new entries.
+       (2c) else the scan is incomplete, define a new coset
+            and continue scanning forward.
+
+    At most len(word) new cosets are defined, the caller must make sure
+    the table has room for them. Return the new number of cosets.
+    """
+    f = coset
+    b = coset
+    i = 0
+    j = len(word) - 1
+    while True:
+        # scan forward as far as possible.
+        while i <= j and table[f, word[i]] != UNDEFINED:
+            f = table[f, word[i]]
+            i += 1
+        # if complete
+        if i > j:
+            # if complete incorrectly a coincidence is found, process it.
+            if f != b:
+                _coincidence(table, p, q, f, b, coxeter)
+            # else the scan yields no information
+            return n
+
+        # if scan forward is not completed then scan backward as
+        # far as possible until it meets the forward scan.
+        while j >= i and table[b, _inv(word[j], coxeter)] != UNDEFINED:
+            b = table[b, _inv(word[j], coxeter)]
+            j -= 1
+
+        # if f and b overlap then a coincidence is found.
+        if j < i:
+            _coincidence(table, p, q, f, b, coxeter)
+            return n
+        # if f and b are about to meet a deduction is found.
+        elif j == i:
+            table[f, word[i]] = b
+            table[b, _inv(word[i], coxeter)] = f
+            return n
+        # else define a new coset and continue scanning forward.
+        else:
+            n = _define(table, p, n, f, word[i], coxeter)
+
+
+@jit(nopython=True, cache=True)
+def _reserve(table, p, q, n, size):
+    """Make sure the table has room for `size` more rows, the capacity
+       is doubled when it overflows.
+    """
+    capacity = table.shape[0]
+    if n + size <= capacity:
+        return table, p, q
+
+    while capacity < n + size:
+        capacity *= 2
+    new_table = np.full((capacity, table.shape[1]), UNDEFINED, dtype=np.int32)
+    new_table[:n] = table[:n]
+    new_p = np.empty(capacity, dtype=np.int32)
+    new_p[:n] = p[:n]
+    return new_table, new_p, np.empty(capacity, dtype=np.int32)
+
+
+@jit(nopython=True, cache=True)
+def _hlt(table, p, n, rels_flat, rels_offsets, subgens_flat, subgens_offsets, coxeter):
+    """Run the HLT strategy (Haselgrove, Leech and Trotter).
+       Return the (possibly reallocated) table, `p` and the number of cosets.
+    """
+    q = np.empty(table.shape[0], dtype=np.int32)
+    for k in range(len(subgens_offsets) - 1):
+        word = subgens_flat[subgens_offsets[k]: subgens_offsets[k + 1]]
+        table, p, q = _reserve(table, p, q, n, len(word))
+        n = _scan_and_fill(table, p, q, n, 0, word, coxeter)
+
+    current = 0
+    while current < n:
+        for k in range(len(rels_offsets) - 1):
+            if p[current] != current:
+                break
+            word = rels_flat[rels_offsets[k]: rels_offsets[k + 1]]
+            table, p, q = _reserve(table, p, q, n, len(word))
+            n = _scan_and_fill(table, p, q, n, current, word, coxeter)
+
+        if p[current] == current:
+            table, p, q = _reserve(table, p, q, n, table.shape[1])
+            for x in range(table.shape[1]):
+                if table[current, x] == UNDEFINED:
+                    n = _define(table, p, n, current, x, coxeter)
+        current += 1
+
+    return table, p, n
+
+
+@jit(nopython=True, cache=True)
+def _compress(table, p, n, coxeter):
+    """Delete all dead cosets in the table. The live cosets are
+       renumbered and their entries are also updated.
+       Return the number of live cosets.
+    """
+    ind = -1
+    for coset in range(n):
+        if p[coset] == coset:
+            ind += 1
+            if ind != coset:
+                for x in range(table.shape[1]):
+                    y = table[coset, x]
+                    if y == coset:
+                        table[ind, x] = ind
+                    else:
+                        table[ind, x] = y
+                        table[y, _inv(x, coxeter)] = ind
+    return ind + 1
+
+
+@jit(nopython=True, cache=True)
+def _swap(table, p, k, l):
+    """Swap two live cosets `k` and `l` in the table."""
+    for x in range(table.shape[1]):
+        # swap the two rows k and l.
+        tmp = table[k, x]
+        table[k, x] = table[l, x]
+        table[l, x] = tmp
+        # modify all k/l in the table.
+        for coset in range(table.shape[0]):
+            # this check is not required for a compressed table.
+            if p[coset] == coset:
+                if table[coset, x] == k:
+                    table[coset, x] = l
+                elif table[coset, x] == l:
+                    table[coset, x] = k
+
+
+@jit(nopython=True, cache=True)
+def _standardize(table, p):
+    """Rearrange the cosets in the table to a standard form."""
+    # the next coset we want to encounter in the table.
+    next_coset = 1
+    for coset in range(table.shape[0]):
+        for x in range(table.shape[1]):
+            y = table[coset, x]
+            if y >= next_coset:
+                if y > next_coset:
+                    _swap(table, p, y, next_coset)
+                next_coset += 1
+                if next_coset == table.shape[0] - 1:
+                    return
 
 
 class CosetTable(object):
@@ -21,11 +312,11 @@ class CosetTable(object):
     of G and their inverses. The entry of T at row k and column x (x is a
     generator or the inverse of a generator) records the right action of
     coset k by x: T[k][x] = kx. If T[k][x] is not defined yet we set it to
-    None. When the algorithm terminates all entries in the table are
+    -1. When the algorithm terminates all entries in the table are
     assigned a non-negative integer, all rows scan correctly under all words
     in R and the first row scans correctly under all generators of H.
     """
-    def __init__(self, gens, rels, subgens=(), coxeter=True):
+    def __init__(self, gens, rels, subgens=(), coxeter=True, rels_offsets=None):
         """
         :param gens: a 1D list of integers that represents the generators,
             e.g. [0, 1, 2] for [a, b, c]
@@ -35,8 +326,11 @@ class CosetTable(object):
             e.g. [[0, 2]] for < ac >.
         :param coxeter: whether this is a Coxeter group. If false then the inverse of
             the generators are also included as generators, else they are not.
+        :param rels_offsets: if given then `rels` is the 1D array of the concatenated
+            relators and `rels_offsets` are their offsets, as returned by `flatten_words`.
+            This saves flattening the same relators again for every table.
 
-        we use a list p to hold the equivalence classes of the cosets,
+        we use an array p to hold the equivalence classes of the cosets,
         p[k] = l means k and l really represent the same coset. It's always
         true that p[k] <= k, if p[k] = k then we call k "alive" else we call
         k "dead". All cosets are created "alive" but as the algorithm runs
@@ -47,18 +341,17 @@ class CosetTable(object):
         A "dead" coset arise when an `coincidence` is found, and while handling
         this coincidence more coincidences may also be found, so we use a queue
         q to hold them.
+
+        The table is a 2D int32 array whose capacity is doubled when it is
+        full, only its first len(p) rows are in use.
         """
         self.coxeter = coxeter
-        if coxeter:
-            self.inv = lambda x: x
-        else:
-            self.inv = lambda x: x - 1 if x % 2 else x + 1
         self.A = gens
         self.R = rels     # relations R between the generators
+        self.R_offsets = rels_offsets
         self.H = subgens  # generators of H
-        self.p = [0]      # initially we only have the 0-th coset H
-        self.q = []       # a queue holds all dead cosets to be processed.
-        self.table = [[None] * len(self.A)]
+        self.p = np.zeros(1, dtype=np.int32)  # initially we only have the 0-th coset H
+        self.table = np.full((1, len(self.A)), UNDEFINED, dtype=np.int32)
 
     def __getitem__(self, item):
         return self.table.__getitem__(item)
@@ -70,216 +363,40 @@ class CosetTable(object):
         """Check if a coset is alive."""
         return self.p[coset] == coset
 
-    def is_defined(self, coset, x):
-        """Check if an entry is defined."""
-        return self[coset][x] is not None
-
-    def undefine(self, coset, x):
-        self[coset][x] = None
-
-    def define(self, coset, x):
-        """To define a new coset we need to:
-            1. Append a new empty row to the table.
-            2. Fill the two entries.
-            3. Add this new coset to `p`.
-        """
-        n = len(self.table)
-        self.table.append([None] * len(self.A))
-        self[coset][x] = n
-        self[n][self.inv(x)] = coset
-        self.p.append(n)
-
-    def rep(self, coset):
-        """Find the minimal equivalent representative of a given coset and
-           modify `p` along the way.
-        """
-        m = coset
-        while m != self.p[m]:
-            m = self.p[m]
-
-        j = coset
-        while j != self.p[j]:
-            j, self.p[j] = self.p[j], m
-
-        return m
-
-    def merge(self, coset1, coset2):
-        """Merge two equivalent cosets. The larger one is declared
-           to "dead" and is added to the queue `q` to be processed later on.
-        """
-        s = self.rep(coset1)
-        t = self.rep(coset2)
-        if s != t:
-            s, t = min(s, t), max(s, t)
-            self.p[t] = s
-            self.q.append(t)
-
-    def scan_and_fill(self, coset, word):
-        """
-        Scan the row of a coset under a given word.
-        1. Firstly we start from the left and scan forward to the right as
-           far as possible.
-           (1a) If it completes correctly then it yields no
-                information, do nothing.
-           (1b) If it completes incorrectly then a coincidence
-                is found, process it.
-           (1c) If it does not complete, go to step 2.
-        2. Then we start from the right and scan backward to the left as far
-           as possible until it "meets" the forward scan `f`. Let this scan
-           results in coset `b`.
-           (2a) if `f` and `b` overlap, then a coincidence
-                is found, process it.
-           (2b) if `f` and `b` are about to meet (with a length 1 gap between)
-                then a deduction is found, fill in the two new entries.
-           (2c) else the scan is incomplete, define a new coset
-                and continue scanning forward.
-        """
-        f = coset
-        b = coset
-        i = 0
-        j = len(word) - 1
-        while True:
-            # scan forward as far as possible.
-            while i <= j and self.is_defined(f, word[i]):
-                f = self[f][word[i]]
-                i += 1
-            # if complete
-            if i > j:
-                # if complete incorrectly a coincidence is found, process it.
-                if f != b:
-                    self.coincidence(f, b)
-                # else the scan yields no information
-                return
-
-            # if scan forward is not completed then scan backward as
-            # far as possible until it meets the forward scan.
-            while j >= i and self.is_defined(b, self.inv(word[j])):
-                b = self[b][self.inv(word[j])]
-                j -= 1
-
-            # if f and b overlap then a coincidence is found.
-            if j < i:
-                self.coincidence(f, b)
-                return
-            # if f and b are about to meet a deduction is found.
-            elif j == i:
-                self[f][word[i]] = b
-                self[b][self.inv(word[i])] = f
-                return
-            # else define a new coset and continue scanning forward.
-            else:
-                self.define(f, word[i])
-
-    def coincidence(self, coset1, coset2):
-        """
-        Process a coincidence. When two cosets are found to be equivalent
-        the larger one is deleted: we need to copy all information in its
-        row to the equivalent row and modify all entries it occurs in the
-        table. During this process new coincidences may be found and they
-        are also processed. The subtle thing here is that we must keep
-        filling/deleting entries in pairs, i.e. we must make sure the table
-        always satisfy table[k][x] = l <===> table[l][y] = k (y = inv(x)).
-        """
-        self.merge(coset1, coset2)
-        # at this stage the queue contains only one item,
-        # but new items may be added to it later.
-        while len(self.q) > 0:
-            e = self.q.pop(0)
-            for x in self.A:
-                if self.is_defined(e, x):
-                    f = self[e][x]
-                    y = self.inv(x)
-                    # the entry (f, y) in the row f is also deleted since we
-                    # must make sure all entries in the table come in pairs.
-                    self.undefine(f, y)
-                    # copy the information at (e, x) to (e1, x),
-                    # but is (e1, x) already defined?
-                    e1 = self.rep(e)
-                    f1 = self.rep(f)
-                    # if (e1, x) is already defined then
-                    # a new coincidence is found.
-                    if self.is_defined(e1, x):
-                        self.merge(f1, self.table[e1][x])
-                    elif self.is_defined(f1, y):
-                        self.merge(e1, self.table[f1][y])
-                    else:
-                        # else (e1, x) is not defined, copy the information
-                        # at (e, x) to (e1, x).
-                        self[e1][x] = f1
-                        self[f1][y] = e1
-                        # keep in mind all changes come in pairs,
-                        # so we also copy the information at (f, y) to (f1, y).
-
     def hlt(self):
         """Run the HLT strategy (Haselgrove, Leech and Trotter).
         """
-        for word in self.H:
-            self.scan_and_fill(0, word)
-
-        current = 0
-        while current < len(self.table):
-            for rel in self.R:
-                if not self.is_alive(current):
-                    break
-                self.scan_and_fill(current, rel)
-
-            if self.is_alive(current):
-                for x in self.A:
-                    if not self.is_defined(current, x):
-                        self.define(current, x)
-            current += 1
+        if self.R_offsets is None:
+            rels_flat, rels_offsets = flatten_words(self.R)
+        else:
+            rels_flat, rels_offsets = self.R, self.R_offsets
+        subgens_flat, subgens_offsets = flatten_words(self.H)
+        table, p, n = _hlt(self.table, self.p, len(self),
+                           rels_flat, rels_offsets,
+                           subgens_flat, subgens_offsets,
+                           self.coxeter)
+        self.table = table[:n]
+        self.p = p[:n]
 
     def compress(self):
         """Delete all dead cosets in the table. The live cosets are
            renumbered and their entries are also updated.
         """
-        ind = -1
-        for coset in range(len(self)):
-            if self.is_alive(coset):
-                ind += 1
-                if ind != coset:
-                    for x in self.A:
-                        y = self[coset][x]
-                        if y == coset:
-                            self[ind][x] = ind
-                        else:
-                            self[ind][x] = y
-                            self[y][self.inv(x)] = ind
-
-        self.p = list(range(ind + 1))
-        self.table = self.table[:len(self.p)]
+        n = _compress(self.table, self.p, len(self), self.coxeter)
+        self.p = np.arange(n, dtype=np.int32)
+        self.table = self.table[:n].copy()
 
     def swap(self, k, l):
         """Swap two live cosets in the table. It's called in the
            `standardize()` method after the table is compressed,
            but it also works for non-compressed table.
         """
-        for x in self.A:
-            # swap the two rows k and l.
-            self[k][x], self[l][x] = self[l][x], self[k][x]
-            # modify all k/l in the table.
-            for coset in range(len(self)):
-                # this check is not required for a compressed table.
-                if self.is_alive(coset):
-                    if self[coset][x] == k:
-                        self[coset][x] = l
-                    elif self[coset][x] == l:
-                        self[coset][x] = k
+        _swap(self.table, self.p, k, l)
 
     def standardize(self):
         """Rearrange the cosets in the table to a standard form.
         """
-        # the next coset we want to encounter in the table.
-        next_coset = 1
-        for coset in range(len(self)):
-            for x in self.A:
-                y = self[coset][x]
-                if y >= next_coset:
-                    if y > next_coset:
-                        self.swap(y, next_coset)
-                    next_coset += 1
-                    if next_coset == len(self) - 1:
-                        return
+        _standardize(self.table, self.p)
 
     def run(self, standard=False):
         self.hlt()